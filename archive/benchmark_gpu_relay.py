@@ -42,33 +42,33 @@ def benchmark_cuda_vs_cpu():
             pubkeys = []
             
             for i in range(batch_size):
-                event_id = bytes([random.randint(0, 255) for _ in range(32)])
-                signature = bytes([random.randint(0, 255) for _ in range(64)])
-                pubkey = bytes([random.randint(0, 255) for _ in range(32)])
+                event_id = random.randbytes(32)
+                signature = random.randbytes(64)
+                pubkey = random.randbytes(32)
                 
                 event_ids.append(event_id)
                 signatures.append(signature)
                 pubkeys.append(pubkey)
             
             # Benchmark CPU
-            cpu_times = []
+            cpu_times_ns = []
             for _ in range(3):
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 for event_id, sig, pubkey in zip(event_ids, signatures, pubkeys):
                     verify_signature_cpu(event_id.hex(), sig.hex(), pubkey.hex())
-                cpu_times.append(time.time() - start_time)
+                cpu_times_ns.append(time.perf_counter_ns() - start_ns)
             
-            cpu_avg = statistics.mean(cpu_times)
+            cpu_avg = statistics.mean(cpu_times_ns) / 1e9
             cpu_throughput = batch_size / cpu_avg
             
             # Benchmark GPU
-            gpu_times = []
+            gpu_times_ns = []
             for _ in range(3):
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 cuda_validator.verify_batch_gpu(event_ids, signatures, pubkeys)
-                gpu_times.append(time.time() - start_time)
+                gpu_times_ns.append(time.perf_counter_ns() - start_ns)
             
-            gpu_avg = statistics.mean(gpu_times)
+            gpu_avg = statistics.mean(gpu_times_ns) / 1e9
             gpu_throughput = batch_size / gpu_avg
             
             speedup = gpu_throughput / cpu_throughput if cpu_throughput > 0 else 0
@@ -6,6 +6,7 @@
 #include <cuda_runtime.h>
 #include <device_launch_parameters.h>
 #include <stdint.h>
+#include <mutex>
 
 // secp256k1 curve parameters
 __constant__ uint64_t SECP256K1_P[4] = {
@@ -566,7 +567,7 @@ void ecdsa_verify_batch(
     const uint8_t* event_ids,      // 32 bytes per event
     const uint8_t* signatures,     // 64 bytes per signature (r,s)
     const uint8_t* pubkeys,        // 32 bytes per pubkey (x coordinate)
-    int* results,                  // Output: 1 = valid, 0 = invalid
+    uint32_t* results,             // Output: bitmask, bit idx set = valid
     int count                      // Number of signatures to verify
 ) {
     int idx = blockIdx.x * blockDim.x + threadIdx.x;
@@ -583,14 +584,12 @@ void ecdsa_verify_batch(
     
     // Basic range checks
     if (is_zero(r) || is_zero(s)) {
-        results[idx] = 0;
         return;
     }
     
     // Check if r, s are in valid range [1, n-1]
     // Simplified check - in production would need proper comparison
     if (r[3] >= SECP256K1_N[3] || s[3] >= SECP256K1_N[3]) {
-        results[idx] = 0;
         return;
     }
     
@@ -612,7 +611,6 @@ void ecdsa_verify_batch(
     bool sqrt_exists = mod_sqrt(y_coord, y_squared);
     
     if (!sqrt_exists) {
-        results[idx] = 0;
         return;
     }
     
@@ -712,77 +710,151 @@ void ecdsa_verify_batch(
         mod_sub(r_check, r_check, SECP256K1_N);
     }
     
+    // Results start zeroed, so only valid signatures need to set their bit
     if (is_equal(r_check, r)) {
-        results[idx] = 1;
-    } else {
-        results[idx] = 0;
+        atomicOr(&results[idx >> 5], 1u << (idx & 31));
     }
 }
 
-// C interface for Python
-extern "C" {
+// Buffers kept across calls and grown on demand. Inputs are laid out
+// contiguously (event_ids | signatures | pubkeys) so a batch goes to the
+// device in a single copy. Host staging is page-locked so the driver can
+// DMA directly instead of bouncing pageable data through its own buffer.
+static uint8_t* h_pinned_inputs = NULL;
+static uint32_t* h_pinned_results = NULL;
+static uint8_t* d_inputs = NULL;
+static uint32_t* d_results = NULL;
+static int buffer_capacity = 0;
+static cudaStream_t stream = NULL;
+
+// The buffers and stream above are shared by every caller. ctypes releases
+// the GIL around calls into this library, so concurrent batches are
+// possible; batch_mutex is held from cuda_ecdsa_begin_batch to
+// cuda_ecdsa_end_batch, covering the caller packing the pinned inputs,
+// the launch, and the caller reading the pinned results. Growing the
+// buffers frees memory another batch may still be using, so it must only
+// happen under the lock too.
+static std::mutex batch_mutex;
+
+static void release_buffers() {
+    if (h_pinned_inputs) cudaFreeHost(h_pinned_inputs);
+    if (h_pinned_results) cudaFreeHost(h_pinned_results);
+    if (d_inputs) cudaFree(d_inputs);
+    if (d_results) cudaFree(d_results);
+    h_pinned_inputs = NULL;
+    h_pinned_results = NULL;
+    d_inputs = NULL;
+    d_results = NULL;
+    buffer_capacity = 0;
+}
+
+static int ensure_buffer_capacity(int count) {
+    if (stream == NULL && cudaStreamCreate(&stream) != cudaSuccess) {
+        stream = NULL;
+        return -1;
+    }
     
-int cuda_ecdsa_verify_batch(
-    const uint8_t* h_event_ids,
-    const uint8_t* h_signatures, 
-    const uint8_t* h_pubkeys,
-    int* h_results,
-    int count
-) {
-    // GPU memory pointers
-    uint8_t *d_event_ids, *d_signatures, *d_pubkeys;
-    int *d_results;
+    if (count <= buffer_capacity) return 0;
     
-    // Calculate sizes
-    size_t event_ids_size = count * 32;
-    size_t signatures_size = count * 64;
-    size_t pubkeys_size = count * 32;
-    size_t results_size = count * sizeof(int);
-    
-    // Allocate GPU memory
-    cudaError_t err;
-    err = cudaMalloc(&d_event_ids, event_ids_size);
-    if (err != cudaSuccess) return -1;
+    release_buffers();
     
-    err = cudaMalloc(&d_signatures, signatures_size);
-    if (err != cudaSuccess) { cudaFree(d_event_ids); return -1; }
+    size_t inputs_size = (size_t)count * 128;
+    size_t results_size = ((size_t)(count + 31) / 32) * sizeof(uint32_t);
     
-    err = cudaMalloc(&d_pubkeys, pubkeys_size);
-    if (err != cudaSuccess) { 
-        cudaFree(d_event_ids); cudaFree(d_signatures); return -1; 
+    if (cudaMallocHost(&h_pinned_inputs, inputs_size) != cudaSuccess ||
+        cudaMallocHost(&h_pinned_results, results_size) != cudaSuccess ||
+        cudaMalloc(&d_inputs, inputs_size) != cudaSuccess ||
+        cudaMalloc(&d_results, results_size) != cudaSuccess) {
+        release_buffers();
+        return -1;
     }
     
-    err = cudaMalloc(&d_results, results_size);
-    if (err != cudaSuccess) { 
-        cudaFree(d_event_ids); cudaFree(d_signatures); cudaFree(d_pubkeys); 
-        return -1; 
+    buffer_capacity = count;
+    return 0;
+}
+
+// C interface for Python
+//
+// Callers pack inputs straight into the pinned buffer, so a batch is
+// copied host-side only once, by the caller:
+//   cuda_ecdsa_begin_batch(count)   - take the batch lock, grow buffers
+//   cuda_ecdsa_input_buffer()       - write event_ids | signatures | pubkeys
+//   cuda_ecdsa_verify_staged(count) - upload, launch and wait
+//   cuda_ecdsa_result_buffer()      - read the result bitmask
+//   cuda_ecdsa_end_batch()          - release the batch lock
+// begin and end must be called from the same thread.
+extern "C" {
+
+int cuda_ecdsa_begin_batch(int count) {
+    batch_mutex.lock();
+    if (ensure_buffer_capacity(count) != 0) {
+        batch_mutex.unlock();
+        return -1;
+    }
+    return 0;
+}
+
+uint8_t* cuda_ecdsa_input_buffer(void) {
+    return h_pinned_inputs;
+}
+
+uint32_t* cuda_ecdsa_result_buffer(void) {
+    return h_pinned_results;
+}
+
+int cuda_ecdsa_verify_staged(int count) {
+    // Only valid inside a begin/end pair sized for at least count events
+    if (count <= 0 || count > buffer_capacity) {
+        return -1;
     }
     
-    // Copy data to GPU
-    cudaMemcpy(d_event_ids, h_event_ids, event_ids_size, cudaMemcpyHostToDevice);
-    cudaMemcpy(d_signatures, h_signatures, signatures_size, cudaMemcpyHostToDevice);
-    cudaMemcpy(d_pubkeys, h_pubkeys, pubkeys_size, cudaMemcpyHostToDevice);
+    // Calculate sizes
+    size_t event_ids_size = (size_t)count * 32;
+    size_t signatures_size = (size_t)count * 64;
+    size_t pubkeys_size = (size_t)count * 32;
+    size_t inputs_size = event_ids_size + signatures_size + pubkeys_size;
+    size_t results_size = ((size_t)(count + 31) / 32) * sizeof(uint32_t);
+    
+    uint8_t* d_event_ids = d_inputs;
+    uint8_t* d_signatures = d_event_ids + event_ids_size;
+    uint8_t* d_pubkeys = d_signatures + signatures_size;
+    
+    // Clear result bitmask; the kernel only sets bits for valid signatures
+    cudaMemsetAsync(d_results, 0, results_size, stream);
+    
+    // Copy all inputs to GPU in one transfer
+    cudaMemcpyAsync(d_inputs, h_pinned_inputs, inputs_size, cudaMemcpyHostToDevice, stream);
     
     // Launch kernel
     int threads_per_block = 256;
     int blocks = (count + threads_per_block - 1) / threads_per_block;
     
-    ecdsa_verify_batch<<<blocks, threads_per_block>>>(
+    ecdsa_verify_batch<<<blocks, threads_per_block, 0, stream>>>(
         d_event_ids, d_signatures, d_pubkeys, d_results, count
     );
     
-    // Copy results back
-    cudaMemcpy(h_results, d_results, results_size, cudaMemcpyDeviceToHost);
-    
-    // Cleanup
-    cudaFree(d_event_ids);
-    cudaFree(d_signatures);
-    cudaFree(d_pubkeys);
-    cudaFree(d_results);
+    // Copy results back into the pinned result buffer
+    cudaMemcpyAsync(h_pinned_results, d_results, results_size, cudaMemcpyDeviceToHost, stream);
+    cudaError_t err = cudaStreamSynchronize(stream);
+    if (err != cudaSuccess) return -1;
     
     // Check for errors
     err = cudaGetLastError();
     return (err == cudaSuccess) ? 0 : -1;
 }
 
+void cuda_ecdsa_end_batch(void) {
+    batch_mutex.unlock();
+}
+
+// Free the persistent buffers and the stream
+void cuda_ecdsa_release(void) {
+    std::lock_guard<std::mutex> lock(batch_mutex);
+    release_buffers();
+    if (stream) {
+        cudaStreamDestroy(stream);
+        stream = NULL;
+    }
+}
+
 }  // extern "C"
\ No newline at end of file
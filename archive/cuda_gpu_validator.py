@@ -2,11 +2,16 @@
 CUDA GPU-accelerated ECDSA signature verification
 """
 
+import atexit
 import ctypes
 import os
 import numpy as np
 from typing import List, Tuple
 
+# Library handles whose release has been registered with atexit, so that
+# building several validators adds only one exit handler per library
+_released_libs = set()
+
 class CudaECDSAValidator:
     """GPU-accelerated ECDSA signature validator using custom CUDA implementation"""
     
@@ -20,6 +25,10 @@ class CudaECDSAValidator:
             if os.path.exists(library_path):
                 self.lib = ctypes.CDLL(library_path)
                 self._setup_function_signatures()
+                # Free the library's persistent pinned/device buffers on exit
+                if self.lib._handle not in _released_libs:
+                    _released_libs.add(self.lib._handle)
+                    atexit.register(self.lib.cuda_ecdsa_release)
                 self.cuda_available = True
                 print("🚀 CUDA ECDSA validator initialized successfully")
             else:
@@ -30,15 +39,20 @@ class CudaECDSAValidator:
             
     def _setup_function_signatures(self):
         """Setup ctypes function signatures"""
-        # cuda_ecdsa_verify_batch function signature
-        self.lib.cuda_ecdsa_verify_batch.argtypes = [
-            ctypes.POINTER(ctypes.c_uint8),  # event_ids
-            ctypes.POINTER(ctypes.c_uint8),  # signatures  
-            ctypes.POINTER(ctypes.c_uint8),  # pubkeys
-            ctypes.POINTER(ctypes.c_int),    # results
-            ctypes.c_int                     # count
-        ]
-        self.lib.cuda_ecdsa_verify_batch.restype = ctypes.c_int
+        # Batch protocol: begin (locks, sizes buffers) -> pack pinned
+        # inputs -> verify_staged -> read pinned results -> end (unlocks)
+        self.lib.cuda_ecdsa_begin_batch.argtypes = [ctypes.c_int]
+        self.lib.cuda_ecdsa_begin_batch.restype = ctypes.c_int
+        self.lib.cuda_ecdsa_input_buffer.argtypes = []
+        self.lib.cuda_ecdsa_input_buffer.restype = ctypes.POINTER(ctypes.c_uint8)
+        self.lib.cuda_ecdsa_result_buffer.argtypes = []
+        self.lib.cuda_ecdsa_result_buffer.restype = ctypes.POINTER(ctypes.c_uint32)
+        self.lib.cuda_ecdsa_verify_staged.argtypes = [ctypes.c_int]
+        self.lib.cuda_ecdsa_verify_staged.restype = ctypes.c_int
+        self.lib.cuda_ecdsa_end_batch.argtypes = []
+        self.lib.cuda_ecdsa_end_batch.restype = None
+        self.lib.cuda_ecdsa_release.argtypes = []
+        self.lib.cuda_ecdsa_release.restype = None
         
     def verify_batch_gpu(self, event_ids: List[bytes], signatures: List[bytes], 
                         pubkeys: List[bytes]) -> List[bool]:
@@ -63,13 +77,6 @@ class CudaECDSAValidator:
         if count == 0:
             return []
             
-        # Prepare input arrays
-        event_ids_array = (ctypes.c_uint8 * (count * 32))()
-        signatures_array = (ctypes.c_uint8 * (count * 64))()
-        pubkeys_array = (ctypes.c_uint8 * (count * 32))()
-        results_array = (ctypes.c_int * count)()
-        
-        # Copy data to ctypes arrays
         for i in range(count):
             if len(event_ids[i]) != 32:
                 raise ValueError(f"Event ID {i} must be 32 bytes")
@@ -77,25 +84,33 @@ class CudaECDSAValidator:
                 raise ValueError(f"Signature {i} must be 64 bytes")
             if len(pubkeys[i]) != 32:
                 raise ValueError(f"Public key {i} must be 32 bytes")
-                
-            for j in range(32):
-                event_ids_array[i * 32 + j] = event_ids[i][j]
-                pubkeys_array[i * 32 + j] = pubkeys[i][j]
-                
-            for j in range(64):
-                signatures_array[i * 64 + j] = signatures[i][j]
         
-        # Call CUDA function
-        result = self.lib.cuda_ecdsa_verify_batch(
-            event_ids_array, signatures_array, pubkeys_array, 
-            results_array, count
-        )
+        if self.lib.cuda_ecdsa_begin_batch(count) != 0:
+            raise RuntimeError("CUDA buffer allocation failed")
         
-        if result != 0:
-            raise RuntimeError(f"CUDA verification failed with error code {result}")
+        try:
+            # Pack inputs straight into the library's pinned staging buffer
+            # (event_ids | signatures | pubkeys), so no further host copy is needed
+            inputs = np.ctypeslib.as_array(self.lib.cuda_ecdsa_input_buffer(), shape=(count * 128,))
+            inputs[:count * 32] = np.frombuffer(b''.join(event_ids), dtype=np.uint8)
+            inputs[count * 32:count * 96] = np.frombuffer(b''.join(signatures), dtype=np.uint8)
+            inputs[count * 96:] = np.frombuffer(b''.join(pubkeys), dtype=np.uint8)
+            
+            # Call CUDA function
+            result = self.lib.cuda_ecdsa_verify_staged(count)
             
-        # Convert results to Python list
-        return [bool(results_array[i]) for i in range(count)]
+            if result != 0:
+                raise RuntimeError(f"CUDA verification failed with error code {result}")
+                
+            # Unpack result bitmask from pinned memory to Python list (one bit
+            # per signature in little-endian 32-bit words, so bit i of the
+            # byte view is event i)
+            results_array = np.ctypeslib.as_array(self.lib.cuda_ecdsa_result_buffer(),
+                                                  shape=((count + 31) // 32,))
+            bits = np.unpackbits(results_array.view(np.uint8), bitorder='little')[:count]
+            return bits.astype(bool).tolist()
+        finally:
+            self.lib.cuda_ecdsa_end_batch()
 
 def verify_signature_gpu(event_id_hex: str, signature_hex: str, pubkey_hex: str) -> bool:
     """
@@ -155,13 +170,29 @@ def verify_signatures_batch_gpu(events_data: List[Tuple[str, str, str]]) -> List
             return [verify_signature_cpu(event_id, sig, pubkey) 
                    for event_id, sig, pubkey in events_data]
         
-        # Convert to bytes
-        event_ids = [bytes.fromhex(event_id) for event_id, _, _ in events_data]
-        signatures = [bytes.fromhex(sig) for _, sig, _ in events_data]
-        pubkeys = [bytes.fromhex(pubkey) for _, _, pubkey in events_data]
-        
-        # GPU batch verification
-        return _cuda_validator.verify_batch_gpu(event_ids, signatures, pubkeys)
+        # Decode each event up front so one malformed event (bad length or
+        # non-hex characters) is marked invalid without aborting the batch
+        event_ids = []
+        signatures = []
+        pubkeys = []
+        well_formed = []
+        for event_id, sig, pubkey in events_data:
+            try:
+                decoded = (bytes.fromhex(event_id), bytes.fromhex(sig), bytes.fromhex(pubkey))
+                # Checked after decoding, since fromhex skips embedded whitespace
+                if tuple(map(len, decoded)) != (32, 64, 32):
+                    raise ValueError("malformed field length")
+            except (ValueError, TypeError):
+                well_formed.append(False)
+                continue
+            event_ids.append(decoded[0])
+            signatures.append(decoded[1])
+            pubkeys.append(decoded[2])
+            well_formed.append(True)
+        
+        # GPU batch verification, scattered back to the original positions
+        good_results = iter(_cuda_validator.verify_batch_gpu(event_ids, signatures, pubkeys))
+        return [next(good_results) if ok else False for ok in well_formed]
         
     except Exception as e:
         print(f"Batch GPU verification error: {e}")
@@ -19,9 +19,9 @@ def generate_test_data(count: int, seed: int = 42) -> tuple:
     pubkeys = []
     
     for i in range(count):
-        event_id = bytes([random.randint(0, 255) for _ in range(32)])
-        signature = bytes([random.randint(0, 255) for _ in range(64)])
-        pubkey = bytes([random.randint(0, 255) for _ in range(32)])
+        event_id = random.randbytes(32)
+        signature = random.randbytes(64)
+        pubkey = random.randbytes(32)
         
         event_ids.append(event_id)
         signatures.append(signature)
@@ -68,32 +68,42 @@ class OptimizedCudaValidator:
             raise RuntimeError("Optimized CUDA not available")
             
         import ctypes
+        import numpy as np
         count = len(event_ids)
-        
-        # Prepare input arrays
-        event_ids_array = (ctypes.c_uint8 * (count * 32))()
-        signatures_array = (ctypes.c_uint8 * (count * 64))()
-        pubkeys_array = (ctypes.c_uint8 * (count * 32))()
-        results_array = (ctypes.c_int * count)()
-        
-        # Copy data
+        if count != len(signatures) or count != len(pubkeys):
+            raise ValueError("Input arrays must have same length")
+            
+        if count == 0:
+            return []
+            
         for i in range(count):
-            for j in range(32):
-                event_ids_array[i * 32 + j] = event_ids[i][j]
-                pubkeys_array[i * 32 + j] = pubkeys[i][j]
-            for j in range(64):
-                signatures_array[i * 64 + j] = signatures[i][j]
+            if len(event_ids[i]) != 32:
+                raise ValueError(f"Event ID {i} must be 32 bytes")
+            if len(signatures[i]) != 64:
+                raise ValueError(f"Signature {i} must be 64 bytes")
+            if len(pubkeys[i]) != 32:
+                raise ValueError(f"Public key {i} must be 32 bytes")
+        
+        # Pack inputs into contiguous uint8 arrays with one join + memcpy per field
+        event_ids_array = np.frombuffer(b''.join(event_ids), dtype=np.uint8)
+        signatures_array = np.frombuffer(b''.join(signatures), dtype=np.uint8)
+        pubkeys_array = np.frombuffer(b''.join(pubkeys), dtype=np.uint8)
+        results_array = np.zeros(count, dtype=np.intc)
         
         # Call optimized CUDA function
+        u8_ptr = ctypes.POINTER(ctypes.c_uint8)
         result = self.lib.cuda_ecdsa_verify_batch_optimized(
-            event_ids_array, signatures_array, pubkeys_array, 
-            results_array, count
+            event_ids_array.ctypes.data_as(u8_ptr),
+            signatures_array.ctypes.data_as(u8_ptr),
+            pubkeys_array.ctypes.data_as(u8_ptr),
+            results_array.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+            count
         )
         
         if result != 0:
             raise RuntimeError(f"Optimized CUDA verification failed with error code {result}")
             
-        return [bool(results_array[i]) for i in range(count)]
+        return results_array.astype(bool).tolist()
 
 def benchmark_original_cuda(batch_sizes: List[int]) -> Dict[int, Dict[str, float]]:
     """Benchmark original CUDA implementation"""
@@ -119,13 +129,15 @@ def benchmark_original_cuda(batch_sizes: List[int]) -> Dict[int, Dict[str, float
             validator.verify_batch_gpu(event_ids[:1], signatures[:1], pubkeys[:1])
             
             # Benchmark
-            times = []
+            times_ns = []
             for _ in range(5):
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 validator.verify_batch_gpu(event_ids, signatures, pubkeys)
-                end_time = time.time()
-                times.append(end_time - start_time)
+                end_ns = time.perf_counter_ns()
+                times_ns.append(end_ns - start_ns)
             
+            # Convert to seconds only after the timed runs
+            times = [t / 1e9 for t in times_ns]
             avg_time = statistics.mean(times)
             throughput = batch_size / avg_time
             
@@ -167,13 +179,15 @@ def benchmark_optimized_cuda(batch_sizes: List[int]) -> Dict[int, Dict[str, floa
             validator.verify_batch_gpu(event_ids[:1], signatures[:1], pubkeys[:1])
             
             # Benchmark
-            times = []
+            times_ns = []
             for _ in range(5):
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 validator.verify_batch_gpu(event_ids, signatures, pubkeys)
-                end_time = time.time()
-                times.append(end_time - start_time)
+                end_ns = time.perf_counter_ns()
+                times_ns.append(end_ns - start_ns)
             
+            # Convert to seconds only after the timed runs
+            times = [t / 1e9 for t in times_ns]
             avg_time = statistics.mean(times)
             throughput = batch_size / avg_time
             
@@ -208,14 +222,16 @@ def benchmark_cpu_baseline(batch_sizes: List[int]) -> Dict[int, Dict[str, float]
             event_ids, signatures, pubkeys = generate_test_data(batch_size)
             
             # Benchmark
-            times = []
+            times_ns = []
             for _ in range(3):  # Fewer runs for CPU since it's slower
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 for event_id, sig, pubkey in zip(event_ids, signatures, pubkeys):
                     verify_signature_cpu(event_id.hex(), sig.hex(), pubkey.hex())
-                end_time = time.time()
-                times.append(end_time - start_time)
+                end_ns = time.perf_counter_ns()
+                times_ns.append(end_ns - start_ns)
             
+            # Convert to seconds only after the timed runs
+            times = [t / 1e9 for t in times_ns]
             avg_time = statistics.mean(times)
             throughput = batch_size / avg_time
             
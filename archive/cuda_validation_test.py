@@ -20,9 +20,9 @@ def generate_test_data(seed: int) -> Tuple[str, str, str]:
     random.seed(seed)
     
     # Generate random-looking but deterministic data
-    event_id = bytes([random.randint(0, 255) for _ in range(32)])
-    signature = bytes([random.randint(0, 255) for _ in range(64)])  
-    pubkey = bytes([random.randint(0, 255) for _ in range(32)])
+    event_id = random.randbytes(32)
+    signature = random.randbytes(64)  
+    pubkey = random.randbytes(32)
     
     return event_id.hex(), signature.hex(), pubkey.hex()
 
@@ -64,6 +64,85 @@ def test_deterministic_cases():
         print(f"   ❌ CPU verification error: {e}")
         return False
 
+def test_cpu_pubkey_parity():
+    """Test CPU verification of real signatures from even-y and odd-y public keys"""
+    print("\n🔑 Testing CPU verification for both public key parities...")
+    
+    try:
+        from gpu_validator import verify_signature_cpu
+        
+        # Nostr pubkeys are x-only, so keys with an odd y-coordinate (0x03
+        # prefix) must verify just like even-y (0x02) keys
+        keys_per_parity = 20
+        keys = {0x02: [], 0x03: []}
+        while min(len(k) for k in keys.values()) < keys_per_parity:
+            private_key = secp256k1.PrivateKey()
+            prefix = private_key.pubkey.serialize(compressed=True)[0]
+            if len(keys[prefix]) < keys_per_parity:
+                keys[prefix].append(private_key)
+        
+        for prefix, private_keys in keys.items():
+            for private_key in private_keys:
+                event_hash = hashlib.sha256(secrets.token_bytes(32)).digest()
+                signature = private_key.ecdsa_serialize_compact(private_key.ecdsa_sign(event_hash))
+                pubkey_hex = private_key.pubkey.serialize(compressed=True)[1:].hex()
+                
+                if not verify_signature_cpu(event_hash.hex(), signature.hex(), pubkey_hex):
+                    print(f"   ❌ Valid signature rejected for 0x{prefix:02x} key {pubkey_hex}")
+                    return False
+                
+                # Flip one bit in s; the signature must no longer verify
+                flipped = bytearray(signature)
+                flipped[63] ^= 0x01
+                if verify_signature_cpu(event_hash.hex(), flipped.hex(), pubkey_hex):
+                    print(f"   ❌ Flipped signature accepted for 0x{prefix:02x} key {pubkey_hex}")
+                    return False
+            
+            print(f"   ✅ 0x{prefix:02x} keys: {len(private_keys)} valid accepted, {len(private_keys)} flipped rejected")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ CPU verification error: {e}")
+        return False
+
+def test_event_serialization():
+    """Check the archived event builder hashes the NIP-01 json.dumps form"""
+    print("\n🧾 Testing canonical event serialization...")
+    
+    try:
+        import json
+        from test_client import create_nostr_event
+        from gpu_validator import verify_signature_cpu
+        
+        # Non-ASCII, quotes and escapes must serialize exactly like json.dumps
+        event = create_nostr_event('Unicode ü 😀 "quoted" \\ back\nslash')
+        
+        serialized = json.dumps([
+            0,
+            event["pubkey"],
+            event["created_at"],
+            event["kind"],
+            event["tags"],
+            event["content"],
+        ], separators=(',', ':'), ensure_ascii=False)
+        expected_id = hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+        
+        if event["id"] != expected_id:
+            print(f"   ❌ Event ID {event['id']} != canonical {expected_id}")
+            return False
+        
+        if not verify_signature_cpu(event["id"], event["sig"], event["pubkey"]):
+            print("   ❌ Event signature rejected")
+            return False
+        
+        print("   ✅ Event ID matches canonical serialization and signature verifies")
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Serialization test error: {e}")
+        return False
+
 def test_cuda_vs_cpu_correctness():
     """Compare CUDA vs CPU verification results for identical inputs"""
     print("\n🔬 Testing CUDA vs CPU correctness...")
@@ -284,18 +363,18 @@ def performance_baseline():
                 pubkeys.append(bytes.fromhex(pubkey_hex))
             
             # CPU timing
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             cpu_results = []
             for event_id, sig, pubkey in zip(event_ids, signatures, pubkeys):
                 result = verify_signature_cpu(event_id.hex(), sig.hex(), pubkey.hex())
                 cpu_results.append(result)
-            cpu_time = time.time() - start_time
+            cpu_time = (time.perf_counter_ns() - start_ns) / 1e9
             cpu_throughput = batch_size / cpu_time
             
             # CUDA timing
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             cuda_results = validator.verify_batch_gpu(event_ids, signatures, pubkeys)
-            cuda_time = time.time() - start_time
+            cuda_time = (time.perf_counter_ns() - start_ns) / 1e9
             cuda_throughput = batch_size / cuda_time
             
             print(f"   💻 CPU:  {cpu_throughput:8.1f} ops/sec ({cpu_time:.4f}s)")
@@ -318,22 +397,32 @@ if __name__ == "__main__":
         print("❌ Deterministic test cases failed")
         exit(1)
     
-    # Step 2: Test CUDA vs CPU correctness
+    # Step 2: Test CPU verification for both pubkey parities
+    if not test_cpu_pubkey_parity():
+        print("❌ CPU pubkey parity test failed")
+        exit(1)
+    
+    # Step 3: Test canonical event serialization
+    if not test_event_serialization():
+        print("❌ Event serialization test failed")
+        exit(1)
+    
+    # Step 4: Test CUDA vs CPU correctness
     if not test_cuda_vs_cpu_correctness():
         print("❌ CUDA vs CPU correctness test failed")
         exit(1)
     
-    # Step 3: Test batch verification
+    # Step 5: Test batch verification
     if not test_cuda_batch_correctness():
         print("❌ CUDA batch correctness test failed") 
         exit(1)
     
-    # Step 4: Test edge cases
+    # Step 6: Test edge cases
     if not test_edge_cases():
         print("❌ Edge case test failed")
         exit(1)
     
-    # Step 5: Performance baseline
+    # Step 7: Performance baseline
     performance_baseline()
     
     print("\n🎉 All validation tests passed!")
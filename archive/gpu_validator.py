@@ -3,7 +3,24 @@ Custom validator plug-in for nostr-relay
 CPU-based signature verification (GPU placeholder for future implementation)
 """
 
-import secp256k1
+import hashlib
+from functools import lru_cache
+
+from secp256k1 import ffi, lib, secp256k1_ctx
+
+@lru_cache(maxsize=4096)
+def _load_pubkeys(pubkey_hex: str):
+    """Parse a 32-byte x-only pubkey, cached since one author signs many events"""
+    # The x-coordinate alone loses the y-parity, so keep both the
+    # 0x02 (even y) and 0x03 (odd y) compressed forms
+    pubkey_bytes = bytes.fromhex(pubkey_hex)
+    pubkeys = []
+    for prefix in (b'\x02', b'\x03'):
+        pubkey = ffi.new("secp256k1_pubkey *")
+        if not lib.secp256k1_ec_pubkey_parse(secp256k1_ctx, pubkey, prefix + pubkey_bytes, 33):
+            raise ValueError("invalid public key")
+        pubkeys.append(pubkey)
+    return tuple(pubkeys)
 
 def verify_signature_cpu(event_id_hex: str, signature_hex: str, pubkey_hex: str) -> bool:
     """CPU signature verification"""
@@ -11,17 +28,27 @@ def verify_signature_cpu(event_id_hex: str, signature_hex: str, pubkey_hex: str)
         # Convert hex to bytes
         event_id = bytes.fromhex(event_id_hex)
         signature_bytes = bytes.fromhex(signature_hex)
-        pubkey_bytes = bytes.fromhex(pubkey_hex)
         
-        # Create PublicKey object - pubkey_hex is 32 bytes (x-coordinate), add 0x02 prefix for compressed format
-        pubkey_full = b'\x02' + pubkey_bytes
-        pubkey = secp256k1.PublicKey(pubkey_full, raw=True)
+        # Load public key candidates from the per-author cache
+        pubkeys = _load_pubkeys(pubkey_hex)
+        
+        # Parse signature from compact format (64 bytes). Allocated per call:
+        # cffi releases the GIL in the libsecp256k1 calls, so a shared struct
+        # could be overwritten by another thread mid-verify
+        if len(signature_bytes) != 64:
+            return False
+        signature = ffi.new("secp256k1_ecdsa_signature *")
+        if not lib.secp256k1_ecdsa_signature_parse_compact(secp256k1_ctx, signature, signature_bytes):
+            return False
         
-        # Deserialize signature from compact format (64 bytes)
-        signature = pubkey.ecdsa_deserialize_compact(signature_bytes)
+        # Signers sign sha256(event_id), matching PublicKey.ecdsa_verify's default digest
+        msg32 = hashlib.sha256(event_id).digest()
         
-        # Verify signature - parameter order: (message, signature)
-        return pubkey.ecdsa_verify(event_id, signature)
+        # Verify signature against either y-parity
+        for pubkey in pubkeys:
+            if lib.secp256k1_ecdsa_verify(secp256k1_ctx, signature, msg32, pubkey):
+                return True
+        return False
     except Exception:
         return False
 
@@ -45,17 +72,16 @@ class GpuSigValidator:
     async def validate(self, events):
         """
         Validate a batch of events using CPU verification
-        Returns list[bool] aligned with events indicating validity
+        Returns a bytearray aligned with events, non-zero where the event is valid
         """
-        if not events:
-            return []
-        
-        results = []
-        for event in events:
+        results = bytearray(len(events))
+        for i, event in enumerate(events):
             try:
-                is_valid = verify_signature_cpu(event.id, event.sig, event.pubkey)
-                results.append(is_valid)
+                # Cheap gate: skip the crypto entirely for malformed hex lengths
+                if len(event.id) == 64 and len(event.sig) == 128 and len(event.pubkey) == 64:
+                    results[i] = verify_signature_cpu(event.id, event.sig, event.pubkey)
             except Exception:
-                results.append(False)
+                # Missing or non-string fields leave the event marked invalid
+                pass
         
         return results
\ No newline at end of file
@@ -6,52 +6,15 @@ Send a valid Nostr event to the GPU relay
 import asyncio
 import json
 import time
-import hashlib
-import secp256k1
 import websockets
 
+from test_client import create_nostr_event
+
 def create_valid_event(content: str, private_key_hex: str = None):
     """Create a valid Nostr event with proper signature"""
     
-    # Use a fixed private key for testing or generate a new one
-    if private_key_hex:
-        private_key = secp256k1.PrivateKey(bytes.fromhex(private_key_hex))
-    else:
-        private_key = secp256k1.PrivateKey()
-    
-    # Get 32-byte public key (x-coordinate only)
-    public_key_bytes = private_key.pubkey.serialize(compressed=True)
-    pubkey_hex = public_key_bytes[1:].hex()
-    
-    # Verify exactly 32 bytes
-    assert len(bytes.fromhex(pubkey_hex)) == 32
-    
-    # Create event structure
-    event = {
-        "pubkey": pubkey_hex,
-        "created_at": int(time.time()),
-        "kind": 1,  # Text note
-        "tags": [],
-        "content": content,
-    }
-    
-    # Create event ID (hash) according to NIP-01
-    serialized = json.dumps([
-        0,
-        event["pubkey"],
-        event["created_at"],
-        event["kind"],
-        event["tags"],
-        event["content"],
-    ], separators=(',', ':'), ensure_ascii=False)
-    
-    event_hash = hashlib.sha256(serialized.encode('utf-8')).digest()
-    event["id"] = event_hash.hex()
-    
-    # Sign the event hash
-    signature = private_key.ecdsa_sign(event_hash)
-    signature_compact = private_key.ecdsa_serialize_compact(signature)
-    event["sig"] = signature_compact.hex()
+    # Shared event builder, so both clients sign events the same way
+    event = create_nostr_event(content, private_key_hex)
     
     print(f"📝 Event created:")
     print(f"   ID: {event['id']}")
@@ -63,7 +26,7 @@ def create_valid_event(content: str, private_key_hex: str = None):
 async def send_to_relay(event, relay_url="ws://localhost:6969"):
     """Send event to relay and show result"""
     try:
-        async with websockets.connect(relay_url) as websocket:
+        async with websockets.connect(relay_url, compression=None, ping_interval=None, close_timeout=0.5) as websocket:
             # Send EVENT message
             message = ["EVENT", event]
             await websocket.send(json.dumps(message))
@@ -35,15 +35,12 @@ def create_nostr_event(content: str, private_key_hex: str = None):
         "content": content,
     }
     
-    # Create event ID according to NIP-01
-    serialized = json.dumps([
-        0,
-        event["pubkey"],
-        event["created_at"],
-        event["kind"],
-        event["tags"],
-        event["content"],
-    ], separators=(',', ':'), ensure_ascii=False)
+    # Create event ID according to NIP-01, building the canonical string
+    # directly: tags are always empty, so only the list round-trip is skipped
+    serialized = (
+        f'[0,"{pubkey_hex}",{event["created_at"]},{event["kind"]},[],'
+        f'{json.dumps(content, ensure_ascii=False)}]'
+    )
     
     event_hash = hashlib.sha256(serialized.encode('utf-8')).digest()
     event["id"] = event_hash.hex()
@@ -58,7 +55,7 @@ def create_nostr_event(content: str, private_key_hex: str = None):
 async def send_event_to_relay(uri: str, event):
     """Send event to Nostr relay"""
     try:
-        async with websockets.connect(uri) as websocket:
+        async with websockets.connect(uri, compression=None, ping_interval=None, close_timeout=0.5) as websocket:
             # Send EVENT message
             msg = json.dumps(["EVENT", event])
             await websocket.send(msg)
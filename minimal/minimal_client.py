@@ -10,6 +10,8 @@ private_key = secp256k1.PrivateKey()
 public_key_obj = private_key.pubkey
 # Get the x-coordinate only (exactly 32 bytes, no prefix)
 pk_hex = public_key_obj.serialize(compressed=True)[1:].hex()  # Remove 0x02/0x03 prefix
+# Leading part of the NIP-01 serialization, fixed for this key
+canonical_prefix = f'[0,"{pk_hex}",'
 
 def create_event(content: str):
     event = {
@@ -19,14 +21,12 @@ def create_event(content: str):
         "tags": [],
         "content": content,
     }
-    serialized = json.dumps([
-        0,
-        event["pubkey"],
-        event["created_at"],
-        event["kind"],
-        event["tags"],
-        event["content"],
-    ], separators=(',', ':'), ensure_ascii=False)
+    # Canonical NIP-01 serialization built directly: tags are always empty,
+    # so only created_at and content vary and the list round-trip is skipped
+    serialized = (
+        f'{canonical_prefix}{event["created_at"]},{event["kind"]},[],'
+        f'{json.dumps(content, ensure_ascii=False)}]'
+    )
     event_id = hashlib.sha256(serialized.encode()).hexdigest()
     event["id"] = event_id
     
@@ -37,7 +37,7 @@ def create_event(content: str):
     return event
 
 async def send_event(uri: str, event):
-    async with websockets.connect(uri) as ws:
+    async with websockets.connect(uri, compression=None, ping_interval=None, close_timeout=0.5) as ws:
         msg = json.dumps(["EVENT", event])
         await ws.send(msg)
         print("sent:", msg)
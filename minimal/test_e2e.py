@@ -1,4 +1,6 @@
 import unittest
+import json
+import hashlib
 import sys
 import os
 
@@ -45,5 +47,21 @@ class TestVerifyEvent(unittest.TestCase):
         result = verify_event(event)
         self.assertFalse(result, "Event with invalid ID should fail verification")
 
+    def test_event_id_matches_canonical_serialization(self):
+        """Test that create_event hashes the same bytes as the NIP-01 json.dumps form"""
+        # Non-ASCII, quotes and escapes must serialize exactly like json.dumps
+        event = create_event('Unicode ü 😀 "quoted" \\ back\nslash')
+
+        serialized = json.dumps([
+            0,
+            event["pubkey"],
+            event["created_at"],
+            event["kind"],
+            event["tags"],
+            event["content"],
+        ], separators=(',', ':'), ensure_ascii=False)
+        expected_id = hashlib.sha256(serialized.encode()).hexdigest()
+        self.assertEqual(event["id"], expected_id, "Event ID should match canonical serialization")
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file